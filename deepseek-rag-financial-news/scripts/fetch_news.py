@@ -1,14 +1,30 @@
 import os
-import json
+import sys
+import re
+import asyncio
+import calendar
+import codecs
+import concurrent.futures
+import functools
+import hashlib
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
 import time
+import threading
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from selectolax.lexbor import LexborHTMLParser, SelectolaxError
 import random
-from urllib.parse import urljoin
-import concurrent.futures
+from urllib.parse import urljoin, urlparse
+from operator import itemgetter
+import httpx
+import soupsieve
 import cloudscraper  # For bypassing Cloudflare protection
 from fake_useragent import UserAgent  # For better user agent rotation
 
@@ -19,6 +35,100 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Common article body selectors, in priority order
+ARTICLE_BODY_SELECTORS = [
+    'article', '.article-body', '.article-content', '.story-body',
+    '.story-content', '.post-content', '.entry-content', 'main',
+    '#article-body', '#content-body', '.content-article', '.article__body',
+    '[itemprop="articleBody"]', '.news-content', '.article-text'
+]
+
+# Compiled once at import. They are tried in order, so the search stops at the
+# first selector that matches (a union would evaluate every branch over the whole tree)
+ARTICLE_BODY_SELECTORS_COMPILED = [CSSSelector(selector, translator='html') for selector in ARTICLE_BODY_SELECTORS]
+
+# Charset parameter of a Content-Type header
+CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Short names for the selector fields of a source configuration
+SELECTOR_KEYS = {
+    'article': 'article_selector',
+    'title': 'title_selector',
+    'link': 'link_selector',
+    'summary': 'summary_selector',
+    'date': 'date_selector'
+}
+
+# Selectors simple enough for find()/find_all(): a tag name with at most one class
+SIMPLE_SELECTOR_RE = re.compile(r'^([a-z][a-z0-9]*)(?:\.([A-Za-z0-9_-]+))?$')
+
+# Month names and abbreviations, independent of the current locale
+MONTH_NUMBERS = {}
+for _number, _name in enumerate([
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december'
+], start=1):
+    MONTH_NUMBERS[_name] = _number
+    MONTH_NUMBERS[_name[:3]] = _number
+
+# Relative dates such as '5 mins ago' or '2 hours ago'
+RELATIVE_DATE_RE = re.compile(r'(\d+)\s*(minute|min|hour|hr|day|week|month)s?\b')
+RELATIVE_DATE_UNITS = {
+    'minute': timedelta(minutes=1),
+    'min': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'hr': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30)  # Approximate a month as 30 days
+}
+
+# Absolute date formats, tried in order; 'mon' is a month name, patterns without 'y' use the current year
+ABSOLUTE_DATE_PATTERNS = [re.compile(pattern) for pattern in [
+    r'(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2})',            # 2024-03-14
+    r'(?P<mon>[a-z]+)\s+(?P<d>\d{1,2}),\s+(?P<y>\d{4})',        # Mar 14, 2024 / March 14, 2024
+    r'(?P<d>\d{1,2})\s+(?P<mon>[a-z]+)\s+(?P<y>\d{4})',         # 14 Mar 2024 / 14 March 2024
+    r'(?P<m>\d{1,2})/(?P<d>\d{1,2})/(?P<y>\d{4})',             # 03/14/2024
+    r'(?P<d>\d{1,2})/(?P<m>\d{1,2})/(?P<y>\d{4})',             # 14/03/2024
+    r'(?P<y>\d{4})/(?P<m>\d{1,2})/(?P<d>\d{1,2})',             # 2024/03/14
+    r'(?P<m>\d{1,2})-(?P<d>\d{1,2})-(?P<y>\d{4})',             # 03-14-2024
+    r'(?P<d>\d{1,2})-(?P<m>\d{1,2})-(?P<y>\d{4})',             # 14-03-2024
+    r'(?P<mon>[a-z]+)\s+(?P<d>\d{1,2})',                        # Mar 14 / March 14
+    r'(?P<d>\d{1,2})\s+(?P<mon>[a-z]+)'                         # 14 Mar / 14 March
+]]
+
+class TokenBucket:
+    """Thread-safe token bucket usable from both threads and coroutines."""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # A negative balance queues callers behind the tokens already promised
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+    
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+    
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
 class FinancialNewsScraper:
     """Scraper for collecting financial news from multiple free sources."""
     
@@ -98,6 +208,12 @@ class FinancialNewsScraper:
         }
     }
     
+    # One shared (read-only) source reference per source, reused by every article it yields
+    SOURCE_REFS = {
+        source_id: {'id': sys.intern(source_id), 'name': sys.intern(source_config['name'])}
+        for source_id, source_config in SOURCES.items()
+    }
+    
     def __init__(self):
         """Initialize the scraper with advanced request handling."""
         # Use cloudscraper to bypass Cloudflare protection
@@ -109,6 +225,18 @@ class FinancialNewsScraper:
             }
         )
         
+        # Keep bigger per-host connection pools so repeat requests reuse TCP/TLS connections.
+        # The https adapter has to stay a CipherSuiteAdapter to keep cloudscraper's TLS setup.
+        https_adapter = self.scraper.get_adapter('https://')
+        self.scraper.mount('https://', cloudscraper.CipherSuiteAdapter(
+            ssl_context=https_adapter.ssl_context,
+            source_address=https_adapter.source_address,
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=0
+        ))
+        self.scraper.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+        
         # Use fake_useragent for better user agent rotation
         try:
             self.user_agent = UserAgent()
@@ -128,9 +256,39 @@ class FinancialNewsScraper:
         self.output_file = os.path.join('data', 'raw_news.json')
         os.makedirs('data', exist_ok=True)
         
-        # Add delay between requests to avoid rate limiting
-        self.min_delay = 1
-        self.max_delay = 3
+        # Conditional-GET validators for listing pages, with the bodies they refer to
+        self.http_cache_file = os.path.join('data', 'http_cache.json')
+        self.http_cache_dir = os.path.join('data', 'http_cache')
+        os.makedirs(self.http_cache_dir, exist_ok=True)
+        self._etag_cache: Dict[str, Dict] = self._load_cache(self.http_cache_file)
+        
+        # Parsed articles for the last listing body seen per URL, kept across runs
+        # so that a listing answered by a 304 is not parsed again
+        self.parsed_cache_file = os.path.join('data', 'parsed_cache.json')
+        self._parsed_cache: Dict[str, Dict] = self._load_cache(self.parsed_cache_file)
+        self._cache_lock = threading.Lock()
+        
+        # Per-host rate limiting: a steady request rate with short bursts allowed
+        self.requests_per_second = 1
+        self.burst_size = 5
+        self._buckets: Dict[str, TokenBucket] = {}
+        
+        # Limits for the async client and the article content fan-out
+        self.http_limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        self.max_concurrent_fetches = 32
+        
+        # Sources whose selectors Lexbor can handle; the rest fall back to BeautifulSoup
+        self._lexbor_sources = {
+            source_id for source_id, source_config in self.SOURCES.items()
+            if self._lexbor_supports(source_config)
+        }
+        
+        # Precompiled soupsieve selectors for the BeautifulSoup fallback sources
+        self._compiled = {
+            source_id: self._compile_selectors(source_config)
+            for source_id, source_config in self.SOURCES.items()
+            if source_id not in self._lexbor_sources
+        }
         
     def _get_random_user_agent(self) -> str:
         """Return a random user agent."""
@@ -139,9 +297,17 @@ class FinancialNewsScraper:
         else:
             return random.choice(self.USER_AGENTS)
     
-    def _make_request(self, url: str) -> Optional[str]:
-        """Make an HTTP request with advanced error handling and retries."""
-        headers = {
+    def _get_bucket(self, url: str) -> TokenBucket:
+        """Return the rate limiter for the host of a URL."""
+        host = urlparse(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets.setdefault(host, TokenBucket(self.requests_per_second, self.burst_size))
+        return bucket
+    
+    def _build_headers(self) -> Dict[str, str]:
+        """Build browser-like request headers with a random user agent."""
+        return {
             'User-Agent': self._get_random_user_agent(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
@@ -151,18 +317,142 @@ class FinancialNewsScraper:
             'Cache-Control': 'max-age=0',
             'TE': 'Trailers',
         }
+    
+    @staticmethod
+    def _load_cache(path: str) -> Dict[str, Dict]:
+        """Load a cache saved by an earlier run, or start empty."""
+        try:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache {path}: {str(e)}")
+            return {}
+    
+    def _save_http_cache(self) -> None:
+        """
+        Persist the conditional-GET validators and the parsed listings for the next run.
+        
+        Scrapes may run on several threads, so writes are serialized and each file is
+        replaced atomically; a reader never sees a half-written cache.
+        """
+        with self._cache_lock:
+            for path, cache in ((self.http_cache_file, self._etag_cache), (self.parsed_cache_file, self._parsed_cache)):
+                tmp_path = f"{path}.tmp"
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+                    os.replace(tmp_path, path)
+                except Exception as e:
+                    logger.error(f"Error saving cache {path}: {str(e)}")
+    
+    def _cache_path(self, body_hash: str) -> str:
+        """Return where the cached body with this hash is stored."""
+        return os.path.join(self.http_cache_dir, f"{body_hash}.html")
+    
+    def _conditional_headers(self, url: str) -> Tuple[Dict[str, str], Optional[Tuple[bytes, Optional[str]]]]:
+        """
+        Return the If-None-Match/If-Modified-Since headers for a URL and the cached
+        body and encoding they validate. Nothing is sent if the cached body is gone, since a 304
+        would then leave us with nothing to parse.
+        """
+        entry = self._etag_cache.get(url)
+        if not entry:
+            return {}, None
+        
+        try:
+            with open(self._cache_path(entry['body_hash']), 'rb') as f:
+                cached_body = f.read()
+        except OSError:
+            return {}, None
+        
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers, (cached_body, entry.get('encoding'))
+    
+    def _store_response(self, url: str, response_headers, body: bytes, encoding: Optional[str]) -> None:
+        """Remember the validators and body of a listing page for the next conditional GET."""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        previous = self._etag_cache.pop(url, None)
+        
+        if etag or last_modified:
+            body_hash = hashlib.sha256(body).hexdigest()
+            try:
+                with open(self._cache_path(body_hash), 'wb') as f:
+                    f.write(body)
+            except OSError as e:
+                logger.warning(f"Could not cache response for {url}: {str(e)}")
+                return
+            self._etag_cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body_hash': body_hash,
+                'encoding': encoding,
+            }
+            if previous and previous['body_hash'] == body_hash:
+                return
         
+        # Drop the body the old validators pointed at
+        if previous:
+            try:
+                os.remove(self._cache_path(previous['body_hash']))
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _declared_encoding(response_headers) -> Optional[str]:
+        """
+        Return the Content-Type charset, or None if there is no usable one.
+        
+        The header's own name is kept: codecs.lookup() names such as 'euc_jp' are
+        Python-only and unknown to libxml2, so lookup only validates the charset.
+        """
+        match = CHARSET_RE.search(response_headers.get('Content-Type', ''))
+        if not match:
+            return None
+        try:
+            codecs.lookup(match.group(1))
+        except LookupError:
+            return None
+        return match.group(1)
+    
+    def _make_request(self, url: str, conditional: bool = False) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        Make an HTTP request with advanced error handling and retries.
+        
+        Returns the decompressed response body as bytes together with the charset
+        declared in the Content-Type header (None if there is none). The parsers
+        decode with that charset, and otherwise sniff the document itself.
+        
+        With conditional=True the request is revalidated against the cached
+        ETag/Last-Modified, and a 304 answer returns the cached body and encoding.
+        """
+        headers = self._build_headers()
+        cached = None
+        if conditional:
+            validators, cached = self._conditional_headers(url)
+            headers.update(validators)
         max_retries = 3
         
         for attempt in range(max_retries):
             try:
-                # Add random delay between requests
-                time.sleep(random.uniform(self.min_delay, self.max_delay))
+                # Wait only if this host has used up its request budget
+                self._get_bucket(url).acquire()
                 
                 # Try with cloudscraper first
                 response = self.scraper.get(url, headers=headers, timeout=15)
+                if response.status_code == 304 and cached is not None:
+                    return cached
                 response.raise_for_status()
-                return response.text
+                encoding = self._declared_encoding(response.headers)
+                if conditional:
+                    self._store_response(url, response.headers, response.content, encoding)
+                return response.content, encoding
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Request failed (attempt {attempt+1}/{max_retries}): {str(e)}")
                 
@@ -174,176 +464,435 @@ class FinancialNewsScraper:
                     logger.error(f"Failed to fetch {url} after {max_retries} attempts")
                     return None
     
+    async def _make_request_async(self, client: httpx.AsyncClient, url: str, conditional: bool = False) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Make an HTTP request on the shared async client, with the same retry and caching policy as _make_request."""
+        headers = self._build_headers()
+        cached = None
+        if conditional:
+            validators, cached = self._conditional_headers(url)
+            headers.update(validators)
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            try:
+                # Wait only if this host has used up its request budget
+                await self._get_bucket(url).acquire_async()
+                
+                response = await client.get(url, headers=headers, timeout=15)
+                if response.status_code in (403, 503):
+                    # Most likely a Cloudflare challenge, which only cloudscraper can solve
+                    return await asyncio.to_thread(self._make_request, url, conditional)
+                if response.status_code == 304 and cached is not None:
+                    return cached
+                response.raise_for_status()
+                encoding = self._declared_encoding(response.headers)
+                if conditional:
+                    self._store_response(url, response.headers, response.content, encoding)
+                return response.content, encoding
+            except httpx.HTTPError as e:
+                logger.warning(f"Request failed (attempt {attempt+1}/{max_retries}): {str(e)}")
+                
+                if attempt < max_retries - 1:
+                    # Exponential backoff with jitter
+                    sleep_time = (2 ** attempt) + random.uniform(0, 1)
+                    await asyncio.sleep(sleep_time)
+                else:
+                    logger.error(f"Failed to fetch {url} after {max_retries} attempts")
+                    return None
+    
     def _parse_date(self, date_text: str) -> str:
         """Parse various date formats into ISO format."""
+        # Relative dates are resolved against the current minute so repeated strings hit the cache
+        now = datetime.now().replace(second=0, microsecond=0)
         try:
-            date_text = date_text.lower().strip()
-            
-            # Handle relative dates
-            if 'ago' in date_text:
-                if 'minute' in date_text or 'min' in date_text:
-                    minutes = int(''.join(filter(str.isdigit, date_text)))
-                    date = datetime.now() - timedelta(minutes=minutes)
-                elif 'hour' in date_text or 'hr' in date_text:
-                    hours = int(''.join(filter(str.isdigit, date_text)))
-                    date = datetime.now() - timedelta(hours=hours)
-                elif 'day' in date_text:
-                    days = int(''.join(filter(str.isdigit, date_text)))
-                    date = datetime.now() - timedelta(days=days)
-                elif 'week' in date_text:
-                    weeks = int(''.join(filter(str.isdigit, date_text)))
-                    date = datetime.now() - timedelta(weeks=weeks)
-                elif 'month' in date_text:
-                    # Approximate a month as 30 days
-                    months = int(''.join(filter(str.isdigit, date_text)))
-                    date = datetime.now() - timedelta(days=30*months)
-                else:
-                    date = datetime.now()
-                return date.isoformat()
-            
-            # Handle "today" and "yesterday"
-            if 'today' in date_text:
-                return datetime.now().isoformat()
-            if 'yesterday' in date_text:
-                return (datetime.now() - timedelta(days=1)).isoformat()
-            
-            # Try common date formats
-            for fmt in [
-                '%Y-%m-%d', '%b %d, %Y', '%d %b %Y', '%B %d, %Y', '%d %B %Y', 
-                '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d', '%m-%d-%Y', '%d-%m-%Y',
-                '%b %d', '%d %b', '%B %d', '%d %B'  # Formats without year
-            ]:
-                try:
-                    # For formats without year, add current year
-                    parsed_date = datetime.strptime(date_text.strip(), fmt)
-                    if parsed_date.year == 1900:
-                        parsed_date = parsed_date.replace(year=datetime.now().year)
-                    return parsed_date.isoformat()
-                except ValueError:
-                    continue
-            
-            # Default to current date if parsing fails
-            return datetime.now().isoformat()
+            return self._parse_date_cached(date_text.lower().strip(), now)
         except Exception as e:
             logger.warning(f"Date parsing error: {str(e)}")
             return datetime.now().isoformat()
     
-    def _scrape_source(self, source_id: str, source_config: Dict) -> List[Dict]:
-        """Scrape a single news source."""
-        logger.info(f"Scraping news from {source_config['name']}...")
-        articles = []
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_date_cached(date_text: str, now: datetime) -> str:
+        """Parse a normalized date string relative to now; memoized per (text, minute)."""
+        # Handle relative dates
+        if 'ago' in date_text:
+            match = RELATIVE_DATE_RE.search(date_text)
+            if match:
+                date = now - int(match.group(1)) * RELATIVE_DATE_UNITS[match.group(2)]
+            else:
+                date = now
+            return date.isoformat()
         
-        html = self._make_request(source_config['url'])
-        if not html:
-            logger.warning(f"No HTML content retrieved from {source_config['name']}")
-            return articles
+        # Handle "today" and "yesterday"
+        if 'today' in date_text:
+            return now.isoformat()
+        if 'yesterday' in date_text:
+            return (now - timedelta(days=1)).isoformat()
         
-        soup = BeautifulSoup(html, 'html.parser')
-        article_elements = soup.select(source_config['article_selector'])
+        # Try common date formats
+        for pattern in ABSOLUTE_DATE_PATTERNS:
+            match = pattern.fullmatch(date_text)
+            if not match:
+                continue
+            fields = match.groupdict()
+            year = int(fields['y']) if 'y' in fields else now.year
+            month = MONTH_NUMBERS.get(fields['mon']) if 'mon' in fields else int(fields['m'])
+            day = int(fields['d'])
+            # Validate instead of letting datetime() raise, so the next format gets a chance
+            if year >= 1 and month and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+                return datetime(year, month, day).isoformat()
         
-        logger.info(f"Found {len(article_elements)} potential article elements on {source_config['name']}")
+        # Default to current date if parsing fails
+        return now.isoformat()
+    
+    @staticmethod
+    def _lexbor_supports(source_config: Dict) -> bool:
+        """Check whether Lexbor can parse every selector configured for a source."""
+        probe = LexborHTMLParser('<html></html>')
+        for key in SELECTOR_KEYS.values():
+            if not source_config[key]:
+                continue
+            try:
+                probe.css_first(source_config[key])
+            except SelectolaxError:
+                return False
+        return True
+    
+    def _extract_with_lexbor(self, html: bytes, encoding: Optional[str], source_config: Dict) -> Iterator[Tuple[str, str, str, Optional[str]]]:
+        """Yield (title, link, summary, date_text) for each article using Lexbor."""
+        # Lexbor reads bytes as UTF-8, so any other declared charset is decoded up front
+        if encoding and codecs.lookup(encoding).name != 'utf-8':
+            html = html.decode(encoding, errors='replace')
+        tree = LexborHTMLParser(html)
+        article_elements = tree.css(source_config['article_selector'])
+        
+        source_name = source_config['name']
+        logger.info(f"Found {len(article_elements)} potential article elements on {source_name}")
+        
+        # Bind everything the loop needs to locals
+        title_sel = source_config['title_selector']
+        link_sel = source_config['link_selector']
+        summary_sel = source_config['summary_selector']
+        date_sel = source_config['date_selector']
         
         for article in article_elements:
             try:
                 # Extract title
-                title_element = article.select_one(source_config['title_selector'])
+                title_element = article.css_first(title_sel)
+                if not title_element:
+                    continue
+                title = title_element.text().strip()
+                
+                # Extract link
+                link_element = article.css_first(link_sel)
+                link = link_element.attributes.get('href') if link_element else None
+                if link is None:
+                    continue
+                
+                # Extract summary if available
+                summary = ""
+                if summary_sel:
+                    summary_element = article.css_first(summary_sel)
+                    if summary_element:
+                        summary = summary_element.text().strip()
+                
+                # Extract date if available
+                date_text = None
+                if date_sel:
+                    date_element = article.css_first(date_sel)
+                    if date_element:
+                        date_text = date_element.text().strip()
+                
+                yield title, link, summary, date_text
+            except Exception as e:
+                logger.warning(f"Error parsing article from {source_name}: {str(e)}")
+    
+    @staticmethod
+    def _compile_selector(selector: str) -> Tuple[str, object]:
+        """Classify a selector as a find() lookup or a precompiled soupsieve selector."""
+        match = SIMPLE_SELECTOR_RE.match(selector)
+        if match:
+            tag_name, class_name = match.groups()
+            return 'find', (tag_name, {'class': class_name} if class_name else {})
+        return 'select', soupsieve.compile(selector)
+    
+    def _compile_selectors(self, source_config: Dict) -> Optional[Dict]:
+        """Compile a source's selectors so they are parsed only once."""
+        try:
+            return {
+                name: self._compile_selector(source_config[key]) if source_config[key] else None
+                for name, key in SELECTOR_KEYS.items()
+            }
+        except soupsieve.SelectorSyntaxError as e:
+            logger.warning(f"Invalid selector for {source_config['name']}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _soup_select(node, selector: Tuple[str, object]) -> List:
+        """Return all elements under node matching a compiled selector."""
+        method, target = selector
+        if method == 'find':
+            return node.find_all(*target)
+        return target.select(node)
+    
+    @staticmethod
+    def _soup_select_one(node, selector: Tuple[str, object]):
+        """Return the first element under node matching a compiled selector."""
+        method, target = selector
+        if method == 'find':
+            return node.find(*target)
+        return target.select_one(node)
+    
+    @staticmethod
+    def _soup_strainer(selector: str) -> Optional[SoupStrainer]:
+        """
+        Build a SoupStrainer from the tag names of a selector group.
+        
+        Straining lifts every kept subtree up to sibling level, which changes what
+        combinators and structural pseudo-classes such as :first-child match, so only
+        groups of plain tag[.class] selectors are strained.
+        """
+        tag_names = []
+        for part in selector.split(','):
+            match = SIMPLE_SELECTOR_RE.match(part.strip())
+            if not match:
+                return None
+            tag_names.append(match.group(1))
+        return SoupStrainer(tag_names)
+    
+    def _extract_with_soup(self, html: bytes, encoding: Optional[str], source_config: Dict, selectors: Dict) -> Iterator[Tuple[str, str, str, Optional[str]]]:
+        """Yield (title, link, summary, date_text) for each article using BeautifulSoup."""
+        article_elements = []
+        strainer = self._soup_strainer(source_config['article_selector'])
+        if strainer:
+            soup = BeautifulSoup(html, 'lxml', parse_only=strainer, from_encoding=encoding)
+            article_elements = self._soup_select(soup, selectors['article'])
+        if not article_elements:
+            # Fall back to parsing the whole page
+            soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+            article_elements = self._soup_select(soup, selectors['article'])
+        
+        source_name = source_config['name']
+        logger.info(f"Found {len(article_elements)} potential article elements on {source_name}")
+        
+        # Bind everything the loop needs to locals
+        select_one = self._soup_select_one
+        title_sel = selectors['title']
+        link_sel = selectors['link']
+        summary_sel = selectors['summary']
+        date_sel = selectors['date']
+        
+        for article in article_elements:
+            try:
+                # Extract title
+                title_element = select_one(article, title_sel)
                 if not title_element:
                     continue
                 title = title_element.get_text().strip()
                 
                 # Extract link
-                link_element = article.select_one(source_config['link_selector'])
+                link_element = select_one(article, link_sel)
                 if not link_element or not link_element.has_attr('href'):
                     continue
                 link = link_element['href']
                 
-                # Make sure link is absolute
-                if not link.startswith(('http://', 'https://')):
-                    link = urljoin(source_config['url'], link)
-                
                 # Extract summary if available
                 summary = ""
-                if source_config['summary_selector']:
-                    summary_element = article.select_one(source_config['summary_selector'])
+                if summary_sel:
+                    summary_element = select_one(article, summary_sel)
                     if summary_element:
                         summary = summary_element.get_text().strip()
                 
                 # Extract date if available
-                published_at = datetime.now().isoformat()
-                if source_config['date_selector']:
-                    date_element = article.select_one(source_config['date_selector'])
+                date_text = None
+                if date_sel:
+                    date_element = select_one(article, date_sel)
                     if date_element:
                         date_text = date_element.get_text().strip()
-                        published_at = self._parse_date(date_text)
                 
-                articles.append({
-                    'source': {
-                        'id': source_id,
-                        'name': source_config['name']
-                    },
-                    'title': title,
-                    'description': summary,
-                    'url': link,
-                    'publishedAt': published_at,
-                    'content': None  # Will be filled if fetch_article_content is called
-                })
+                yield title, link, summary, date_text
             except Exception as e:
-                logger.warning(f"Error parsing article from {source_config['name']}: {str(e)}")
+                logger.warning(f"Error parsing article from {source_name}: {str(e)}")
+    
+    def _scrape_source(self, source_id: str, source_config: Dict) -> List[Dict]:
+        """Scrape a single news source."""
+        logger.info(f"Scraping news from {source_config['name']}...")
+        
+        response = self._make_request(source_config['url'], conditional=True)
+        if not response or not response[0]:
+            logger.warning(f"No HTML content retrieved from {source_config['name']}")
+            return []
+        
+        html, encoding = response
+        articles = self._parse_source(source_id, source_config, html, encoding)
+        
+        # There is no batch to save after on this path, so keep the validators now
+        self._save_http_cache()
+        return articles
+    
+    async def _scrape_source_async(self, client: httpx.AsyncClient, source_id: str, source_config: Dict) -> List[Dict]:
+        """Scrape a single news source on the shared async client."""
+        logger.info(f"Scraping news from {source_config['name']}...")
+        
+        response = await self._make_request_async(client, source_config['url'], conditional=True)
+        if not response or not response[0]:
+            logger.warning(f"No HTML content retrieved from {source_config['name']}")
+            return []
+        
+        html, encoding = response
+        return self._parse_source(source_id, source_config, html, encoding)
+    
+    def _parse_source(self, source_id: str, source_config: Dict, html: bytes, encoding: Optional[str] = None) -> List[Dict]:
+        """Extract articles from the HTML of a source's listing page."""
+        url_base = source_config['url']
+        
+        # An unchanged listing page (e.g. a 304 answered from cache) parses to the same articles
+        body_hash = hashlib.sha256(html).hexdigest()
+        cached = self._parsed_cache.get(url_base)
+        if cached and cached['body_hash'] == body_hash and cached['encoding'] == encoding:
+            logger.info(f"{source_config['name']} unchanged since last scrape, reusing {len(cached['articles'])} articles")
+            # Entries loaded from disk carry their own copy of the source; share the interned one
+            source_ref = self.SOURCE_REFS[source_id]
+            return [{**article, 'source': source_ref} for article in cached['articles']]
+        
+        articles = []
+        
+        if source_id in self._lexbor_sources:
+            extracted = self._extract_with_lexbor(html, encoding, source_config)
+        elif self._compiled.get(source_id):
+            extracted = self._extract_with_soup(html, encoding, source_config, self._compiled[source_id])
+        else:
+            logger.warning(f"No usable selectors for {source_config['name']}")
+            return articles
+        
+        # Bind everything the loop needs to locals
+        parsed_base = urlparse(url_base)
+        scheme = parsed_base.scheme
+        origin = f"{scheme}://{parsed_base.netloc}"
+        source_ref = self.SOURCE_REFS[source_id]
+        parse_date = self._parse_date
+        
+        for title, link, summary, date_text in extracted:
+            # Make sure link is absolute; root-relative links only need the origin
+            if link.startswith('//'):
+                link = scheme + ':' + link
+            elif link.startswith('/'):
+                link = origin + link
+            elif not link.startswith(('http://', 'https://')):
+                link = urljoin(url_base, link)
+            
+            published_at = parse_date(date_text) if date_text else datetime.now().isoformat()
+            
+            articles.append({
+                'source': source_ref,
+                'title': title,
+                'description': summary,
+                'url': link,
+                'publishedAt': published_at,
+                'content': None  # Will be filled if fetch_article_content is called
+            })
         
         logger.info(f"Successfully extracted {len(articles)} articles from {source_config['name']}")
+        # Copies, so that filling in content later does not touch the cached entries
+        self._parsed_cache[url_base] = {
+            'body_hash': body_hash,
+            'encoding': encoding,
+            'articles': [dict(article) for article in articles],
+        }
         return articles
     
+    @staticmethod
+    def _find_article_body(tree: lxml.html.HtmlElement) -> Optional[lxml.html.HtmlElement]:
+        """Return the first element matching the article body selectors, by selector priority."""
+        for selector in ARTICLE_BODY_SELECTORS_COMPILED:
+            matches = selector(tree)
+            if matches:
+                return matches[0]
+        return None
+    
     def fetch_article_content(self, article: Dict) -> Dict:
         """Fetch and parse the full content of an article."""
         if not article.get('url'):
             return article
         
         try:
-            html = self._make_request(article['url'])
-            if not html:
-                return article
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Remove script, style, nav, header, footer elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                element.decompose()
-            
-            # Get text from article body - try multiple common selectors
-            article_body = None
-            
-            # Try common article body selectors
-            for selector in [
-                'article', '.article-body', '.article-content', '.story-body',
-                '.story-content', '.post-content', '.entry-content', 'main',
-                '#article-body', '#content-body', '.content-article', '.article__body',
-                '[itemprop="articleBody"]', '.news-content', '.article-text'
-            ]:
-                article_body = soup.select_one(selector)
-                if article_body:
-                    break
-            
-            if article_body:
-                # Get text and clean it up
-                content = article_body.get_text(separator='\n').strip()
-                # Remove excessive newlines and whitespace
-                content = '\n'.join(line.strip() for line in content.split('\n') if line.strip())
-                article['content'] = content
-            else:
-                # Fallback: get all paragraph text if no article body found
-                paragraphs = soup.find_all('p')
-                if paragraphs:
-                    content = '\n'.join(p.get_text().strip() for p in paragraphs if p.get_text().strip())
-                    article['content'] = content
+            response = self._make_request(article['url'])
+            if response and response[0]:
+                self._parse_article_content(article, *response)
         except Exception as e:
             logger.warning(f"Error fetching article content for {article['url']}: {str(e)}")
         
         return article
     
+    async def fetch_article_content_async(self, client: httpx.AsyncClient, article: Dict) -> Dict:
+        """Fetch and parse the full content of an article on the shared async client."""
+        if not article.get('url'):
+            return article
+        
+        try:
+            response = await self._make_request_async(client, article['url'])
+            if response and response[0]:
+                # Parse off the event loop so one large page doesn't stall the other in-flight fetches
+                await asyncio.to_thread(self._parse_article_content, article, *response)
+        except Exception as e:
+            logger.warning(f"Error fetching article content for {article['url']}: {str(e)}")
+        
+        return article
+    
+    def _parse_article_content(self, article: Dict, html: bytes, encoding: Optional[str] = None) -> None:
+        """Fill in article['content'] from the HTML of the article page."""
+        # Without a declared charset libxml2 only sniffs BOMs and <meta charset>
+        parser = None
+        if encoding:
+            try:
+                parser = lxml.html.HTMLParser(encoding=encoding)
+            except LookupError:
+                # A charset Python knows but libxml2 doesn't: let libxml2 sniff it instead
+                logger.debug(f"libxml2 has no {encoding} codec, sniffing {article['url']}")
+        tree = lxml.html.document_fromstring(html, parser=parser)
+        
+        # Remove script, style, nav, header, footer elements in a single pass
+        etree.strip_elements(tree, 'script', 'style', 'nav', 'header', 'footer', 'aside', with_tail=False)
+        
+        # Get text from article body - try multiple common selectors
+        article_body = self._find_article_body(tree)
+        
+        if article_body is not None:
+            # Get text and clean it up
+            content = '\n'.join(article_body.itertext())
+            # Remove excessive newlines and whitespace
+            content = '\n'.join(filter(None, (line.strip() for line in content.splitlines())))
+            article['content'] = content
+        else:
+            # Fallback: get all paragraph text if no article body found
+            paragraphs = tree.findall('.//p')
+            if paragraphs:
+                content = '\n'.join(filter(None, (p.text_content().strip() for p in paragraphs)))
+                article['content'] = content
+    
     def fetch_news(self, sources: List[str] = None, fetch_content: bool = False, save: bool = True) -> List[Dict]:
         """
         Fetch financial news from multiple sources.
         
+        Runs fetch_news_async on a new event loop; see it for arguments. When the
+        caller already has a running loop (Jupyter, an async app), that loop can't
+        be reentered, so the fetch runs on a loop of its own in a worker thread and
+        this call blocks until it is done. Async callers should await
+        fetch_news_async instead.
+        """
+        coroutine = self.fetch_news_async(sources, fetch_content=fetch_content, save=save)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    
+    async def fetch_news_async(self, sources: List[str] = None, fetch_content: bool = False, save: bool = True) -> List[Dict]:
+        """
+        Fetch financial news from multiple sources concurrently.
+        
         Args:
             sources: List of source IDs to scrape (defaults to all)
             fetch_content: Whether to fetch full article content
@@ -360,31 +909,37 @@ class FinancialNewsScraper:
         
         all_articles = []
         
-        # Use ThreadPoolExecutor to scrape sources in parallel, but with fewer workers to avoid overloading
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(3, len(sources))) as executor:
-            future_to_source = {
-                executor.submit(self._scrape_source, source_id, self.SOURCES[source_id]): source_id
-                for source_id in sources
-            }
+        async with httpx.AsyncClient(http2=True, limits=self.http_limits, follow_redirects=True) as client:
+            # Scrape all sources concurrently on one pooled client
+            results = await asyncio.gather(
+                *[self._scrape_source_async(client, source_id, self.SOURCES[source_id]) for source_id in sources],
+                return_exceptions=True
+            )
             
-            for future in concurrent.futures.as_completed(future_to_source):
-                source_id = future_to_source[future]
-                try:
-                    articles = future.result()
-                    all_articles.extend(articles)
-                except Exception as e:
-                    logger.error(f"Error scraping {source_id}: {str(e)}")
-        
-        # Fetch full content if requested
-        if fetch_content and all_articles:
-            logger.info(f"Fetching full article content for {len(all_articles)} articles...")
+            for source_id, result in zip(sources, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error scraping {source_id}: {str(result)}")
+                else:
+                    all_articles.extend(result)
+            
+            self._save_http_cache()
             
-            # Use a smaller number of workers for content fetching to avoid being blocked
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                all_articles = list(executor.map(self.fetch_article_content, all_articles))
+            # Fetch full content if requested
+            if fetch_content and all_articles:
+                logger.info(f"Fetching full article content for {len(all_articles)} articles...")
+                
+                # Bound the number of in-flight content requests to avoid being blocked
+                semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+                
+                async def fetch_bounded(article: Dict) -> Dict:
+                    async with semaphore:
+                        return await self.fetch_article_content_async(client, article)
+                
+                all_articles = list(await asyncio.gather(*[fetch_bounded(article) for article in all_articles]))
         
         # Sort by published date (newest first)
-        all_articles.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
+        # publishedAt is always set and ISO 8601 strings sort chronologically
+        all_articles.sort(key=itemgetter('publishedAt'), reverse=True)
         
         if save and all_articles:
             self._save_articles(all_articles)
@@ -394,8 +949,8 @@ class FinancialNewsScraper:
     def _save_articles(self, articles: List[Dict]) -> None:
         """Save articles to JSON file."""
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(articles, f, ensure_ascii=False, indent=2)
+            with open(self.output_file, 'wb') as f:
+                f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             logger.info(f"Saved {len(articles)} articles to {self.output_file}")
         except Exception as e:
             logger.error(f"Error saving articles: {str(e)}")
@@ -3,9 +3,12 @@ import json
 import requests
 from datetime import datetime, timedelta
 import logging
-from typing import List, Dict
+import math
+import threading
 import time
+from typing import List, Dict
 from urllib.parse import urlencode
+import concurrent.futures
 
 # Set up logging
 logging.basicConfig(
@@ -16,6 +19,9 @@ logger = logging.getLogger(__name__)
 
 class NewsAPIFetcher:
     BASE_URL = "https://newsapi.org/v2/everything"
+    MAX_RESULTS = 100  # NewsAPI free tier only allows up to 100 results
+    MAX_WORKERS = 5
+    REQUESTS_PER_SECOND = 1  # Shared by all page workers to stay under NewsAPI's rate limit
     
     def __init__(self, api_key: str = None):
         """Initialize NewsAPI client with API key."""
@@ -26,6 +32,10 @@ class NewsAPIFetcher:
         self.output_file = os.path.join('data', 'raw_news.json')
         self.session = requests.Session()
         self.session.headers.update({'Authorization': self.api_key})
+        
+        # Time before which the next request may not start, guarded for the page workers
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
 
     def fetch_financial_news(
         self,
@@ -64,41 +74,24 @@ class NewsAPIFetcher:
             'to': end_date.strftime('%Y-%m-%d'),
             'language': 'en',
             'sortBy': 'publishedAt',
-            'pageSize': 100,  # Maximum allowed by API
-            'page': 1
+            'pageSize': 100  # Maximum allowed by API
         }
         
         all_articles = []
         
         try:
-            while True:
-                logger.info(f"Fetching page {params['page']} of articles...")
-                
-                url = f"{self.BASE_URL}?{urlencode(params)}"
-                response = self.session.get(url)
-                response.raise_for_status()  # Raise exception for bad status codes
-                
-                data = response.json()
-                
-                if data['status'] != 'ok':
-                    raise Exception(f"API Error: {data.get('message', 'Unknown error')}")
-                
-                articles = data.get('articles', [])
-                if not articles:
-                    break
-                    
-                all_articles.extend(articles)
-                
-                # Check if we've reached the total results
-                if len(all_articles) >= data.get('totalResults', 0):
-                    break
-                
-                # NewsAPI free tier only allows up to 100 results
-                if len(all_articles) >= 100:
-                    break
-                    
-                params['page'] += 1
-                time.sleep(1)  # Rate limiting
+            # The first page also tells us how many results there are in total
+            data = self._fetch_page(params, 1)
+            all_articles.extend(data.get('articles', []))
+            
+            total_results = min(data.get('totalResults', 0), self.MAX_RESULTS)
+            n_pages = math.ceil(total_results / params['pageSize'])
+            
+            # Fetch the remaining pages concurrently instead of one after another
+            if all_articles and n_pages > 1:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, n_pages - 1)) as executor:
+                    for page_articles in executor.map(lambda page: self._fetch_remaining_page(params, page), range(2, n_pages + 1)):
+                        all_articles.extend(page_articles)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error: {str(e)}")
@@ -114,6 +107,40 @@ class NewsAPIFetcher:
 
         return all_articles
 
+    def _fetch_page(self, params: Dict, page: int) -> Dict:
+        """Fetch a single page of results and return the decoded response."""
+        logger.info(f"Fetching page {page} of articles...")
+        
+        url = f"{self.BASE_URL}?{urlencode({**params, 'page': page})}"
+        self._wait_for_rate_limit()
+        response = self.session.get(url)
+        response.raise_for_status()  # Raise exception for bad status codes
+        
+        data = response.json()
+        
+        if data['status'] != 'ok':
+            raise Exception(f"API Error: {data.get('message', 'Unknown error')}")
+        
+        return data
+
+    def _fetch_remaining_page(self, params: Dict, page: int) -> List[Dict]:
+        """Fetch the articles of a page after the first, keeping the other pages if it fails."""
+        try:
+            return self._fetch_page(params, page).get('articles', [])
+        except Exception as e:
+            logger.warning(f"Skipping page {page}: {str(e)}")
+            return []
+
+    def _wait_for_rate_limit(self) -> None:
+        """Block until the next request fits within REQUESTS_PER_SECOND."""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + 1 / self.REQUESTS_PER_SECOND
+        
+        if wait > 0:
+            time.sleep(wait)
+
     def _save_articles(self, articles: List[Dict]) -> None:
         """Save articles to JSON file."""
         os.makedirs('data', exist_ok=True)